@@ -0,0 +1,132 @@
+import argparse
+import random
+import time
+from datetime import datetime
+from typing import Dict, List, Any, Callable
+
+from src.utils.validators import (
+    validate_tracking_event,
+    validate_tracking_events,
+    sanitize_input,
+)
+
+EVENT_TYPES = ["created", "shipped", "received", "stored", "delivered"]
+
+
+def generate_events(count: int, invalid_ratio: float = 0.05) -> List[Dict[str, Any]]:
+    rng = random.Random(42)
+    events = []
+    for index in range(count):
+        event = {
+            "product_id": index,
+            "location": f"Warehouse-{rng.randint(1, 500)}\x07",
+            "timestamp": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            f"T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00Z",
+            "event_type": rng.choice(EVENT_TYPES),
+            "temperature": rng.uniform(-20, 40),
+            "humidity": rng.uniform(0, 100),
+            "additional_data": {"sensor": f"sensor-{rng.randint(1, 99)}\r\n"},
+        }
+        if rng.random() < invalid_ratio:
+            event["timestamp"] = "not-a-timestamp"
+        events.append(event)
+    return events
+
+
+def original_validate_tracking_event(event_data: Dict[str, Any]) -> bool:
+    # Reference copy of the validator before batch validation was added
+    required_fields = ["location", "timestamp", "event_type"]
+
+    if not all(field in event_data for field in required_fields):
+        return False
+
+    try:
+        if isinstance(event_data["timestamp"], str):
+            datetime.fromisoformat(event_data["timestamp"].replace("Z", "+00:00"))
+        elif not isinstance(event_data["timestamp"], (int, float)):
+            return False
+    except ValueError:
+        return False
+
+    if not isinstance(event_data["location"], str) or len(event_data["location"]) < 1:
+        return False
+
+    valid_event_types = ["created", "shipped", "received", "stored", "delivered"]
+    if event_data["event_type"] not in valid_event_types:
+        return False
+
+    return True
+
+
+def original_sanitize_input(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    # Reference copy of the character-by-character sanitizer
+    sanitized = {}
+
+    for key, value in input_data.items():
+        if isinstance(value, str):
+            value = "".join(char for char in value if ord(char) >= 32)
+            value = value[:1000]
+        elif isinstance(value, (list, dict)):
+            value = (
+                original_sanitize_input(value)
+                if isinstance(value, dict)
+                else [
+                    original_sanitize_input(item) if isinstance(item, dict) else item
+                    for item in value
+                ]
+            )
+
+        sanitized[key] = value
+
+    return sanitized
+
+
+def original_per_row(events: List[Dict[str, Any]]):
+    return [
+        original_sanitize_input(event)
+        for event in events
+        if original_validate_tracking_event(event)
+    ]
+
+
+def per_row(events: List[Dict[str, Any]]):
+    return [sanitize_input(event) for event in events if validate_tracking_event(event)]
+
+
+def measure(name: str, func: Callable[[], Any], count: int, repeat: int):
+    best = min(_elapsed(func) for _ in range(repeat))
+    print(f"{name:<32} {count / best:>14,.0f} records/s")
+
+
+def _elapsed(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tracking event validation benchmark")
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    events = generate_events(args.count)
+    measure(
+        "original per-row (before)",
+        lambda: original_per_row(events),
+        args.count,
+        args.repeat,
+    )
+    measure(
+        "per-row validate + sanitize", lambda: per_row(events), args.count, args.repeat
+    )
+    measure(
+        "validate_tracking_events",
+        lambda: validate_tracking_events(events),
+        args.count,
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+import json
+import multiprocessing
+import os
+import socket
+import struct
+import threading
+from typing import Dict, List, Any, Tuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.config.settings import (
+    INFERENCE_SOCKET_PATH,
+    INFERENCE_SERVER_PROCESSES,
+    INFERENCE_INTRA_OP_THREADS,
+    INFERENCE_INTER_OP_THREADS,
+    INFERENCE_TIMEOUT,
+)
+from src.utils.logger import ai_logger
+
+# Frame layout: header length, payload length, JSON header, raw feature bytes
+FRAME_PREFIX = struct.Struct("!II")
+ALLOWED_METHODS = {"predict_bottlenecks", "predict_demand"}
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytearray:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:], size - received)
+        if count == 0:
+            raise ConnectionError("Inference socket closed")
+        received += count
+    return buffer
+
+
+def _to_builtin(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _send_message(
+    sock: socket.socket, header: Dict[str, Any], payload: Optional[memoryview] = None
+):
+    header_bytes = json.dumps(header, default=_to_builtin).encode("utf-8")
+    payload_size = payload.nbytes if payload is not None else 0
+    sock.sendall(FRAME_PREFIX.pack(len(header_bytes), payload_size) + header_bytes)
+    if payload_size:
+        # Send straight from the NumPy buffer without copying it
+        sock.sendall(payload)
+
+
+def _recv_message(sock: socket.socket) -> Tuple[Dict[str, Any], bytearray]:
+    header_size, payload_size = FRAME_PREFIX.unpack(
+        _recv_exact(sock, FRAME_PREFIX.size)
+    )
+    header = json.loads(_recv_exact(sock, header_size).decode("utf-8"))
+    payload = _recv_exact(sock, payload_size)
+    return header, payload
+
+
+def _configure_threading():
+    import tensorflow as tf
+
+    # Thread pools are set once per server process, before the model is loaded
+    if INFERENCE_INTRA_OP_THREADS > 0:
+        tf.config.threading.set_intra_op_parallelism_threads(
+            INFERENCE_INTRA_OP_THREADS
+        )
+    if INFERENCE_INTER_OP_THREADS > 0:
+        tf.config.threading.set_inter_op_parallelism_threads(
+            INFERENCE_INTER_OP_THREADS
+        )
+
+
+def _handle_connection(conn: socket.socket, predictor, lock: threading.Lock):
+    with conn:
+        while True:
+            try:
+                header, payload = _recv_message(conn)
+            except ConnectionError:
+                return
+
+            try:
+                method = header["method"]
+                if method not in ALLOWED_METHODS:
+                    raise ValueError(f"Unsupported inference method: {method}")
+
+                # Wrap the received buffer without copying it
+                features = np.frombuffer(payload, dtype=header["dtype"]).reshape(
+                    header["shape"]
+                )
+                data = pd.DataFrame(features, columns=header["columns"], copy=False)
+                # Restore integer and boolean columns sent as float64
+                column_dtypes = {
+                    column: dtype
+                    for column, dtype in zip(header["columns"], header["column_dtypes"])
+                    if dtype != "float64"
+                }
+                if column_dtypes:
+                    data = data.astype(column_dtypes)
+
+                with lock:
+                    result = getattr(predictor, method)(data)
+                _send_message(conn, {"result": result})
+            except ConnectionError:
+                return
+            except Exception as e:
+                ai_logger.error("Inference request failed", error=str(e))
+                _send_message(conn, {"error": str(e)})
+
+
+def _serve_forever(listener: socket.socket):
+    _configure_threading()
+
+    from src.ai.predictor import SupplyChainPredictor
+
+    predictor = SupplyChainPredictor()
+    lock = threading.Lock()
+    ai_logger.info(f"Inference server process {os.getpid()} ready")
+
+    while True:
+        conn, _ = listener.accept()
+        threading.Thread(
+            target=_handle_connection, args=(conn, predictor, lock), daemon=True
+        ).start()
+
+
+def serve(
+    socket_path: str = INFERENCE_SOCKET_PATH,
+    processes: int = INFERENCE_SERVER_PROCESSES,
+):
+    """Run the model server; every process owns one SupplyChainPredictor"""
+    directory = os.path.dirname(socket_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if os.path.exists(socket_path):
+        # Only remove the socket file if no server is accepting on it
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(socket_path)
+        else:
+            raise RuntimeError(
+                f"An inference server is already listening on {socket_path}"
+            )
+        finally:
+            probe.close()
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen(128)
+    ai_logger.info(
+        f"Inference server listening on {socket_path}", processes=processes
+    )
+
+    try:
+        if processes <= 1:
+            _serve_forever(listener)
+        else:
+            # Fork before TensorFlow is imported so each child initializes its own
+            context = multiprocessing.get_context("fork")
+            workers = [
+                context.Process(target=_serve_forever, args=(listener,), daemon=True)
+                for _ in range(processes)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+    finally:
+        listener.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+class RemotePredictor:
+    """Drop-in replacement for SupplyChainPredictor backed by the inference server.
+
+    Features travel as one float64 matrix and each column's dtype is restored
+    on the server, so integer columns above 2**53 lose precision.
+    """
+
+    def __init__(
+        self,
+        socket_path: str = INFERENCE_SOCKET_PATH,
+        timeout: float = INFERENCE_TIMEOUT,
+    ):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._sock = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> socket.socket:
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            self._sock = sock
+        return self._sock
+
+    def _close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _request(
+        self, header: Dict[str, Any], payload: Optional[memoryview]
+    ) -> Dict[str, Any]:
+        sock = self._connect()
+        _send_message(sock, header, payload)
+        response, _ = _recv_message(sock)
+        return response
+
+    def _call(self, method: str, data: pd.DataFrame) -> Any:
+        data = pd.DataFrame(data)
+        features = np.ascontiguousarray(data.to_numpy(dtype=np.float64))
+        header = {
+            "method": method,
+            "columns": [str(column) for column in data.columns],
+            "column_dtypes": [str(dtype) for dtype in data.dtypes],
+            "dtype": features.dtype.str,
+            "shape": list(features.shape),
+        }
+        # memoryview cannot cast arrays with a zero-length dimension
+        payload = memoryview(features).cast("B") if features.size else None
+
+        with self._lock:
+            try:
+                response = self._request(header, payload)
+            except (ConnectionError, FileNotFoundError):
+                # The server may have restarted; reconnect once and retry
+                self._close()
+                try:
+                    response = self._request(header, payload)
+                except OSError:
+                    self._close()
+                    raise
+            except OSError:
+                # Timeouts are not retried; the server may still be running it
+                self._close()
+                raise
+
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response["result"]
+
+    def predict_bottlenecks(self, data: pd.DataFrame) -> List[Dict[str, Any]]:
+        return self._call("predict_bottlenecks", data)
+
+    def predict_demand(self, historical_data: pd.DataFrame) -> Dict[str, Any]:
+        return self._call("predict_demand", historical_data)
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+
+if __name__ == "__main__":
+    serve()
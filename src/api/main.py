@@ -6,13 +6,21 @@ import uvicorn
 
 from src.models.base import get_db
 from src.blockchain.smart_contract import SmartContractManager
-from src.ai.predictor import SupplyChainPredictor
-from src.config.settings import API_V1_PREFIX, PROJECT_NAME, API_PORT
+from src.config.settings import API_V1_PREFIX, PROJECT_NAME, API_PORT, INFERENCE_MODE
 
 app = FastAPI(title=PROJECT_NAME)
 security = HTTPBearer()
 blockchain_manager = SmartContractManager()
-ai_predictor = SupplyChainPredictor()
+
+if INFERENCE_MODE == "remote":
+    # Workers share the model owned by the inference server process
+    from src.ai.inference_server import RemotePredictor
+
+    ai_predictor = RemotePredictor()
+else:
+    from src.ai.predictor import SupplyChainPredictor
+
+    ai_predictor = SupplyChainPredictor()
 
 
 @app.get("/")
@@ -0,0 +1,184 @@
+import statistics
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Dict, Any, Optional
+
+from web3 import Web3
+from web3.exceptions import MethodUnavailable
+
+from src.config.settings import (
+    FEE_POLICY,
+    FEE_HISTORY_BLOCKS,
+    FEE_ORACLE_POLL_INTERVAL,
+    FEE_MIN_PRIORITY_FEE,
+    FEE_MAX_FEE_PER_GAS,
+    GAS_LIMIT_MARGIN,
+    GAS_ESTIMATE_SAMPLES,
+    GAS_ESTIMATE_INTERVAL,
+)
+from src.utils.logger import blockchain_logger
+
+# Priority fee percentile and headroom over the next block's base fee per policy
+FEE_POLICIES = {
+    "slow": {"percentile": 10, "base_fee_multiplier": 1.125},
+    "standard": {"percentile": 50, "base_fee_multiplier": 1.5},
+    "fast": {"percentile": 90, "base_fee_multiplier": 2.0},
+}
+REWARD_PERCENTILES = sorted(policy["percentile"] for policy in FEE_POLICIES.values())
+# Calls per function and calldata size that always run estimate_gas before
+# cached samples are used
+MIN_GAS_SAMPLES = 3
+# JSON-RPC error code for a method the node does not implement
+METHOD_NOT_FOUND = -32601
+
+
+def _is_method_unavailable(error: Exception) -> bool:
+    if isinstance(error, MethodUnavailable):
+        return True
+    # web3 raises ValueError with the JSON-RPC error object for node errors
+    return (
+        isinstance(error, ValueError)
+        and bool(error.args)
+        and isinstance(error.args[0], dict)
+        and error.args[0].get("code") == METHOD_NOT_FOUND
+    )
+
+
+class FeeOracle:
+    """Caches fee market data once per block and gas limits per contract function"""
+
+    def __init__(
+        self,
+        w3: Web3,
+        policy: str = FEE_POLICY,
+        poll_interval: float = FEE_ORACLE_POLL_INTERVAL,
+    ):
+        if policy not in FEE_POLICIES:
+            raise ValueError(f"Unknown fee policy: {policy}")
+        if GAS_ESTIMATE_INTERVAL <= 0:
+            raise ValueError("GAS_ESTIMATE_INTERVAL must be a positive integer")
+
+        self.w3 = w3
+        self.policy = policy
+        self.poll_interval = poll_interval
+
+        self._lock = threading.Lock()
+        self._block_number = None
+        self._base_fee = None
+        self._priority_fees: Dict[int, int] = {}
+        self._gas_price = None
+        self._supports_eip1559 = True
+        self._gas_samples = defaultdict(lambda: deque(maxlen=GAS_ESTIMATE_SAMPLES))
+        self._gas_calls = defaultdict(int)
+        self._thread = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._poll, daemon=True)
+            self._thread.start()
+
+    def _poll(self):
+        while True:
+            try:
+                block_number = self.w3.eth.block_number
+                if block_number != self._block_number:
+                    self.refresh(block_number)
+            except Exception as e:
+                blockchain_logger.warning("Fee oracle refresh failed", error=str(e))
+            time.sleep(self.poll_interval)
+
+    def refresh(self, block_number: Optional[int] = None):
+        if block_number is None:
+            block_number = self.w3.eth.block_number
+
+        if self._supports_eip1559:
+            try:
+                history = self.w3.eth.fee_history(
+                    FEE_HISTORY_BLOCKS, block_number, REWARD_PERCENTILES
+                )
+            except Exception as e:
+                # Only chains without eth_feeHistory fall back to legacy gas
+                # pricing; other errors keep the cached fees and are re-raised
+                if not _is_method_unavailable(e):
+                    raise
+                blockchain_logger.warning(
+                    "eth_feeHistory unavailable, using legacy gas price", error=str(e)
+                )
+            else:
+                priority_fees = {}
+                for index, percentile in enumerate(REWARD_PERCENTILES):
+                    rewards = [
+                        block_rewards[index]
+                        for block_rewards in history.get("reward", [])
+                        if block_rewards
+                    ]
+                    priority_fees[percentile] = (
+                        int(statistics.median(rewards)) if rewards else 0
+                    )
+
+                with self._lock:
+                    # The last entry is the base fee of the next block
+                    self._base_fee = history["baseFeePerGas"][-1]
+                    self._priority_fees = priority_fees
+                    self._block_number = block_number
+                return
+
+        gas_price = self.w3.eth.gas_price
+        with self._lock:
+            self._supports_eip1559 = False
+            self._gas_price = gas_price
+            self._block_number = block_number
+
+    def fee_params(self) -> Dict[str, int]:
+        """Transaction fee fields for the configured policy"""
+        if self._block_number is None:
+            self.refresh()
+            self.start()
+
+        with self._lock:
+            if not self._supports_eip1559:
+                gas_price = self._gas_price
+                if FEE_MAX_FEE_PER_GAS:
+                    gas_price = min(gas_price, FEE_MAX_FEE_PER_GAS)
+                return {"gasPrice": gas_price}
+
+            policy = FEE_POLICIES[self.policy]
+            priority_fee = max(
+                self._priority_fees.get(policy["percentile"], 0), FEE_MIN_PRIORITY_FEE
+            )
+            max_fee = int(self._base_fee * policy["base_fee_multiplier"]) + priority_fee
+
+        if FEE_MAX_FEE_PER_GAS:
+            max_fee = min(max_fee, FEE_MAX_FEE_PER_GAS)
+            priority_fee = min(priority_fee, max_fee)
+
+        return {"maxFeePerGas": max_fee, "maxPriorityFeePerGas": priority_fee}
+
+    def gas_limit(self, contract_function, tx_params: Dict[str, Any]) -> int:
+        """Gas limit from cached estimate_gas samples plus a safety margin"""
+        # Storage writes scale with the string arguments, so samples are kept
+        # per function and calldata size in 32-byte words
+        calldata = contract_function._encode_transaction_data()
+        words = (len(calldata) - 2 + 63) // 64
+        key = (contract_function.fn_name, words)
+
+        with self._lock:
+            calls = self._gas_calls[key]
+            self._gas_calls[key] = calls + 1
+            samples = self._gas_samples[key]
+            # Keep sampling until the window is warm, then re-sample periodically
+            needs_sample = (
+                len(samples) < MIN_GAS_SAMPLES or calls % GAS_ESTIMATE_INTERVAL == 0
+            )
+            cached = max(samples) if samples else 0
+
+        if needs_sample:
+            estimate = contract_function.estimate_gas(tx_params)
+            with self._lock:
+                self._gas_samples[key].append(estimate)
+            cached = max(cached, estimate)
+
+        return int(cached * GAS_LIMIT_MARGIN)
@@ -2,6 +2,7 @@ from web3 import Web3
 from eth_account import Account
 import json
 from typing import Dict, Any
+from src.blockchain.fee_oracle import FeeOracle
 from src.config.settings import BLOCKCHAIN_NETWORK, SMART_CONTRACT_ADDRESS, CHAIN_ID
 
 
@@ -17,22 +18,22 @@ class SmartContractManager:
         self.contract = self.w3.eth.contract(
             address=SMART_CONTRACT_ADDRESS, abi=self.contract_abi
         )
+        self.fee_oracle = FeeOracle(self.w3)
 
-    def create_product(self, product_data: Dict[str, Any], private_key: str) -> str:
+    def _send_transaction(self, contract_function, private_key: str) -> str:
         account = Account.from_key(private_key)
         nonce = self.w3.eth.get_transaction_count(account.address)
 
-        transaction = self.contract.functions.createProduct(
-            product_data["id"],
-            product_data["name"],
-            product_data["manufacturer"],
-            product_data["batch_number"],
-        ).build_transaction(
+        # Gas limit and fees come from the shared oracle instead of per-call RPCs
+        transaction = contract_function.build_transaction(
             {
                 "chainId": CHAIN_ID,
-                "gas": 2000000,
-                "gasPrice": self.w3.eth.gas_price,
+                "from": account.address,
+                "gas": self.fee_oracle.gas_limit(
+                    contract_function, {"from": account.address}
+                ),
                 "nonce": nonce,
+                **self.fee_oracle.fee_params(),
             }
         )
 
@@ -40,27 +41,25 @@ class SmartContractManager:
         tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
         return self.w3.to_hex(tx_hash)
 
+    def create_product(self, product_data: Dict[str, Any], private_key: str) -> str:
+        return self._send_transaction(
+            self.contract.functions.createProduct(
+                product_data["id"],
+                product_data["name"],
+                product_data["manufacturer"],
+                product_data["batch_number"],
+            ),
+            private_key,
+        )
+
     def update_product_status(
         self, product_id: int, status: str, private_key: str
     ) -> str:
-        account = Account.from_key(private_key)
-        nonce = self.w3.eth.get_transaction_count(account.address)
-
-        transaction = self.contract.functions.updateProductStatus(
-            product_id, status
-        ).build_transaction(
-            {
-                "chainId": CHAIN_ID,
-                "gas": 2000000,
-                "gasPrice": self.w3.eth.gas_price,
-                "nonce": nonce,
-            }
+        return self._send_transaction(
+            self.contract.functions.updateProductStatus(product_id, status),
+            private_key,
         )
 
-        signed_txn = self.w3.eth.account.sign_transaction(transaction, private_key)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-        return self.w3.to_hex(tx_hash)
-
     def get_product_history(self, product_id: int) -> list:
         return self.contract.functions.getProductHistory(product_id).call()
 
@@ -70,24 +69,13 @@ class SmartContractManager:
     def add_tracking_event(
         self, product_id: int, event_data: Dict[str, Any], private_key: str
     ) -> str:
-        account = Account.from_key(private_key)
-        nonce = self.w3.eth.get_transaction_count(account.address)
-
-        transaction = self.contract.functions.addTrackingEvent(
-            product_id,
-            event_data["location"],
-            event_data["timestamp"],
-            event_data["event_type"],
-            json.dumps(event_data["additional_data"]),
-        ).build_transaction(
-            {
-                "chainId": CHAIN_ID,
-                "gas": 2000000,
-                "gasPrice": self.w3.eth.gas_price,
-                "nonce": nonce,
-            }
+        return self._send_transaction(
+            self.contract.functions.addTrackingEvent(
+                product_id,
+                event_data["location"],
+                event_data["timestamp"],
+                event_data["event_type"],
+                json.dumps(event_data["additional_data"]),
+            ),
+            private_key,
         )
-
-        signed_txn = self.w3.eth.account.sign_transaction(transaction, private_key)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-        return self.w3.to_hex(tx_hash)
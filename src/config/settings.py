@@ -12,16 +12,42 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent
 # Database configurations
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./supply_chain.db")
 
+# Tracking event archival (rows older than the retention window move to Parquet)
+ARCHIVE_PATH = os.getenv("ARCHIVE_PATH", os.path.join(BASE_DIR, "data", "archive"))
+HOT_RETENTION_DAYS = int(os.getenv("HOT_RETENTION_DAYS", "90"))
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "50000"))
+
 # Blockchain configurations
 BLOCKCHAIN_NETWORK = os.getenv("BLOCKCHAIN_NETWORK", "http://localhost:8545")
 SMART_CONTRACT_ADDRESS = os.getenv("SMART_CONTRACT_ADDRESS", "")
 CHAIN_ID = int(os.getenv("CHAIN_ID", "1"))
 
+# Fee oracle configurations (fees in wei; FEE_POLICY is "slow", "standard" or "fast")
+FEE_POLICY = os.getenv("FEE_POLICY", "standard")
+FEE_HISTORY_BLOCKS = int(os.getenv("FEE_HISTORY_BLOCKS", "20"))
+FEE_ORACLE_POLL_INTERVAL = float(os.getenv("FEE_ORACLE_POLL_INTERVAL", "3"))
+FEE_MIN_PRIORITY_FEE = int(os.getenv("FEE_MIN_PRIORITY_FEE", "1000000000"))
+FEE_MAX_FEE_PER_GAS = int(os.getenv("FEE_MAX_FEE_PER_GAS", "0"))  # 0 disables cap
+GAS_LIMIT_MARGIN = float(os.getenv("GAS_LIMIT_MARGIN", "1.2"))
+GAS_ESTIMATE_SAMPLES = int(os.getenv("GAS_ESTIMATE_SAMPLES", "20"))
+GAS_ESTIMATE_INTERVAL = int(os.getenv("GAS_ESTIMATE_INTERVAL", "10"))
+
 # AI Model configurations
 MODEL_PATH = os.path.join(BASE_DIR, "models")
 PREDICTION_THRESHOLD = 0.8
 TRAINING_DATA_PATH = os.path.join(BASE_DIR, "data", "training")
 
+# Inference server configurations ("local" loads the model in every API worker,
+# "remote" sends batches to the shared inference server)
+INFERENCE_MODE = os.getenv("INFERENCE_MODE", "local")
+INFERENCE_SOCKET_PATH = os.getenv(
+    "INFERENCE_SOCKET_PATH", os.path.join(BASE_DIR, "run", "inference.sock")
+)
+INFERENCE_SERVER_PROCESSES = int(os.getenv("INFERENCE_SERVER_PROCESSES", "1"))
+INFERENCE_INTRA_OP_THREADS = int(os.getenv("INFERENCE_INTRA_OP_THREADS", "0"))
+INFERENCE_INTER_OP_THREADS = int(os.getenv("INFERENCE_INTER_OP_THREADS", "0"))
+INFERENCE_TIMEOUT = float(os.getenv("INFERENCE_TIMEOUT", "30"))
+
 # API configurations
 API_V1_PREFIX = "/api/v1"
 PROJECT_NAME = "AI-Blockchain Supply Chain Management"
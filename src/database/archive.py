@@ -0,0 +1,291 @@
+import json
+import os
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pyarrow import fs
+from sqlalchemy.orm import Session
+
+from src.config.settings import ARCHIVE_PATH, HOT_RETENTION_DAYS, ARCHIVE_BATCH_SIZE
+from src.models.supply_chain import Product, TrackingEvent
+from src.utils.logger import archive_logger
+
+EVENT_COLUMNS = [
+    "id",
+    "product_id",
+    "manufacturer_id",
+    "timestamp",
+    "location",
+    "event_type",
+    "temperature",
+    "humidity",
+    "blockchain_hash",
+    "additional_data",
+]
+
+# Cold partitions are laid out as month=YYYY-MM/manufacturer_id=<id>/
+PARTITIONING = ds.partitioning(
+    pa.schema([("month", pa.string()), ("manufacturer_id", pa.int64())]),
+    flavor="hive",
+)
+
+ARCHIVE_SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("product_id", pa.int64()),
+        ("timestamp", pa.timestamp("us")),
+        ("location", pa.string()),
+        ("event_type", pa.string()),
+        ("temperature", pa.float64()),
+        ("humidity", pa.float64()),
+        ("blockchain_hash", pa.string()),
+        # Stored as a JSON string; decoded only when the column is requested
+        ("additional_data", pa.string()),
+        ("month", pa.string()),
+        ("manufacturer_id", pa.int64()),
+    ]
+)
+
+
+def _hot_cutoff() -> datetime:
+    return datetime.utcnow() - timedelta(days=HOT_RETENTION_DAYS)
+
+
+def _rows_to_table(rows: List[Any]) -> pa.Table:
+    columns = {
+        "id": [],
+        "product_id": [],
+        "timestamp": [],
+        "location": [],
+        "event_type": [],
+        "temperature": [],
+        "humidity": [],
+        "blockchain_hash": [],
+        "additional_data": [],
+        "month": [],
+        "manufacturer_id": [],
+    }
+    for event, manufacturer_id in rows:
+        columns["id"].append(event.id)
+        columns["product_id"].append(event.product_id)
+        columns["timestamp"].append(event.timestamp)
+        columns["location"].append(event.location)
+        columns["event_type"].append(event.event_type)
+        columns["temperature"].append(event.temperature)
+        columns["humidity"].append(event.humidity)
+        columns["blockchain_hash"].append(event.blockchain_hash)
+        columns["additional_data"].append(
+            json.dumps(event.additional_data)
+            if event.additional_data is not None
+            else None
+        )
+        columns["month"].append(event.timestamp.strftime("%Y-%m"))
+        columns["manufacturer_id"].append(manufacturer_id)
+
+    return pa.Table.from_pydict(columns, schema=ARCHIVE_SCHEMA)
+
+
+def archive_tracking_events(
+    db: Session,
+    before: Optional[datetime] = None,
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+    archive_path: str = ARCHIVE_PATH,
+) -> int:
+    """Move tracking events older than the hot window into Parquet partitions"""
+    # Never archive inside the hot window, so recent queries can skip the archive
+    cutoff = min(before, _hot_cutoff()) if before else _hot_cutoff()
+    os.makedirs(archive_path, exist_ok=True)
+    file_format = ds.ParquetFileFormat()
+    file_options = file_format.make_write_options(compression="zstd")
+    archived = 0
+
+    while True:
+        rows = (
+            db.query(TrackingEvent, Product.manufacturer_id)
+            .outerjoin(Product, TrackingEvent.product_id == Product.id)
+            .filter(TrackingEvent.timestamp < cutoff)
+            .order_by(TrackingEvent.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+
+        # Write the partition files before deleting the rows; a crash in between
+        # leaves copies, which query_tracking_events removes by (id, timestamp)
+        ds.write_dataset(
+            _rows_to_table(rows),
+            archive_path,
+            format=file_format,
+            file_options=file_options,
+            partitioning=PARTITIONING,
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+
+        event_ids = [event.id for event, _ in rows]
+        db.query(TrackingEvent).filter(TrackingEvent.id.in_(event_ids)).delete(
+            synchronize_session=False
+        )
+        db.commit()
+        archived += len(rows)
+        archive_logger.info(
+            f"Archived {len(rows)} tracking events", cutoff=cutoff.isoformat()
+        )
+
+    return archived
+
+
+def _cold_filter(
+    product_id: Optional[int],
+    manufacturer_id: Optional[int],
+    event_type: Optional[str],
+    start: Optional[datetime],
+    end: Optional[datetime],
+) -> Optional[ds.Expression]:
+    conditions = []
+    if product_id is not None:
+        conditions.append(ds.field("product_id") == product_id)
+    if manufacturer_id is not None:
+        conditions.append(ds.field("manufacturer_id") == manufacturer_id)
+    if event_type is not None:
+        conditions.append(ds.field("event_type") == event_type)
+    if start is not None:
+        # The month condition prunes whole partitions before any file is opened
+        conditions.append(ds.field("month") >= start.strftime("%Y-%m"))
+        conditions.append(
+            ds.field("timestamp") >= pa.scalar(start, pa.timestamp("us"))
+        )
+    if end is not None:
+        conditions.append(ds.field("month") <= end.strftime("%Y-%m"))
+        conditions.append(ds.field("timestamp") < pa.scalar(end, pa.timestamp("us")))
+
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def _query_cold(columns: List[str], archive_path: str, **filters: Any) -> pd.DataFrame:
+    if not os.path.isdir(archive_path) or not os.listdir(archive_path):
+        return pd.DataFrame(columns=columns)
+
+    dataset = ds.dataset(
+        archive_path,
+        format="parquet",
+        partitioning=PARTITIONING,
+        filesystem=fs.LocalFileSystem(use_mmap=True),
+    )
+    table = dataset.to_table(columns=columns, filter=_cold_filter(**filters))
+    # Match the datetime64[ns] timestamps of the SQL rows so the tiers concatenate
+    frame = table.to_pandas(coerce_temporal_nanoseconds=True)
+
+    if "additional_data" in frame.columns:
+        frame["additional_data"] = [
+            json.loads(value) if value is not None else None
+            for value in frame["additional_data"]
+        ]
+    return frame
+
+
+def _query_hot(
+    db: Session,
+    columns: List[str],
+    product_id: Optional[int],
+    manufacturer_id: Optional[int],
+    event_type: Optional[str],
+    start: Optional[datetime],
+    end: Optional[datetime],
+) -> pd.DataFrame:
+    selected = [
+        (
+            Product.manufacturer_id
+            if column == "manufacturer_id"
+            else getattr(TrackingEvent, column)
+        )
+        for column in columns
+    ]
+    query = (
+        db.query(*selected)
+        .select_from(TrackingEvent)
+        .outerjoin(Product, TrackingEvent.product_id == Product.id)
+    )
+
+    if product_id is not None:
+        query = query.filter(TrackingEvent.product_id == product_id)
+    if manufacturer_id is not None:
+        query = query.filter(Product.manufacturer_id == manufacturer_id)
+    if event_type is not None:
+        query = query.filter(TrackingEvent.event_type == event_type)
+    if start is not None:
+        query = query.filter(TrackingEvent.timestamp >= start)
+    if end is not None:
+        query = query.filter(TrackingEvent.timestamp < end)
+
+    return pd.DataFrame(query.all(), columns=columns)
+
+
+def query_tracking_events(
+    db: Session,
+    product_id: Optional[int] = None,
+    manufacturer_id: Optional[int] = None,
+    event_type: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    columns: Optional[List[str]] = None,
+    archive_path: str = ARCHIVE_PATH,
+) -> pd.DataFrame:
+    """Query tracking events across the database and the Parquet archive.
+
+    Filters are pushed down to both tiers: SQL WHERE clauses for hot rows and
+    partition pruning plus row-group filtering for cold rows.
+    """
+    requested = list(columns or EVENT_COLUMNS)
+    unknown = set(requested) - set(EVENT_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown tracking event columns: {sorted(unknown)}")
+    # id and timestamp identify copies left by an interrupted archive run
+    columns = requested + [
+        column for column in ("id", "timestamp") if column not in requested
+    ]
+
+    filters: Dict[str, Any] = {
+        "product_id": product_id,
+        "manufacturer_id": manufacturer_id,
+        "event_type": event_type,
+        "start": start,
+        "end": end,
+    }
+    hot = _query_hot(db, columns, **filters)
+
+    # Archived rows are always older than the hot window
+    if start is not None and start >= _hot_cutoff():
+        cold = pd.DataFrame(columns=columns)
+    else:
+        cold = _query_cold(columns, archive_path, **filters)
+
+    frames = [frame for frame in (hot, cold) if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=requested)
+
+    events = pd.concat(frames, ignore_index=True)
+    # Ids alone are not unique across tiers: without AUTOINCREMENT, SQLite can
+    # reuse the ids of archived rows, so copies must also match the timestamp
+    events = events.drop_duplicates(subset=["id", "timestamp"], keep="first")
+    events = events.sort_values("timestamp", kind="stable")
+    return events[requested].reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    from src.models.base import SessionLocal
+
+    session = SessionLocal()
+    try:
+        total = archive_tracking_events(session)
+        archive_logger.info(f"Archive job finished, moved {total} tracking events")
+    finally:
+        session.close()
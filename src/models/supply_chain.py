@@ -52,6 +52,8 @@ class Manufacturer(Base):
 
 class TrackingEvent(Base):
     __tablename__ = "tracking_events"
+    # Never reuse ids of rows moved to the Parquet archive
+    __table_args__ = {"sqlite_autoincrement": True}
 
     id = Column(Integer, primary_key=True, index=True)
     product_id = Column(Integer, ForeignKey("products.id"))
@@ -75,7 +75,13 @@ class APILogger(Logger):
         )
 
 
+class ArchiveLogger(Logger):
+    def __init__(self):
+        super().__init__("archive", "logs/archive.log")
+
+
 # Create logger instances
 blockchain_logger = BlockchainLogger()
 ai_logger = AILogger()
 api_logger = APILogger()
+archive_logger = ArchiveLogger()
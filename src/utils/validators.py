@@ -1,53 +1,181 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import re
 from datetime import datetime
 
+PRODUCT_REQUIRED_FIELDS = ("name", "manufacturer", "batch_number")
+TRACKING_EVENT_REQUIRED_FIELDS = ("location", "timestamp", "event_type")
+VALID_EVENT_TYPES = frozenset(["created", "shipped", "received", "stored", "delivered"])
 
-def validate_product_data(product_data: Dict[str, Any]) -> bool:
-    required_fields = ["name", "manufacturer", "batch_number"]
+# Batch number format (e.g., "BATCH-2024-001")
+BATCH_NUMBER_PATTERN = re.compile(r"^BATCH-\d{4}-\d{3}$")
 
-    # Check required fields
-    if not all(field in product_data for field in required_fields):
-        return False
+MAX_STRING_LENGTH = 1000
+CONTROL_CHARACTERS_PATTERN = re.compile(r"[\x00-\x1f]+")
 
-    # Validate name
-    if not isinstance(product_data["name"], str) or len(product_data["name"]) < 1:
-        return False
 
-    # Validate batch number format (e.g., "BATCH-2024-001")
-    batch_pattern = r"^BATCH-\d{4}-\d{3}$"
-    if not re.match(batch_pattern, product_data["batch_number"]):
-        return False
+def _missing_fields_error(data: Dict[str, Any], required_fields) -> Optional[str]:
+    missing = [field for field in required_fields if field not in data]
+    if missing:
+        return f"Missing required fields: {', '.join(missing)}"
+    return None
 
-    return True
+
+def _product_errors(product_data: Any) -> List[str]:
+    if not isinstance(product_data, dict):
+        return ["Product must be an object"]
+
+    missing = _missing_fields_error(product_data, PRODUCT_REQUIRED_FIELDS)
+    if missing:
+        return [missing]
+
+    errors = []
+    name = product_data["name"]
+    if not isinstance(name, str) or len(name) < 1:
+        errors.append("Invalid name")
+
+    batch_number = product_data["batch_number"]
+    if not isinstance(batch_number, str) or not BATCH_NUMBER_PATTERN.match(
+        batch_number
+    ):
+        errors.append("Invalid batch_number")
+
+    return errors
+
+
+def _timestamp_error(timestamp: Any) -> Optional[str]:
+    if isinstance(timestamp, str):
+        try:
+            datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except ValueError:
+            return "Invalid timestamp"
+    elif not isinstance(timestamp, (int, float)):
+        return "Invalid timestamp"
+    return None
+
+
+def _tracking_event_errors(event_data: Any) -> List[str]:
+    if not isinstance(event_data, dict):
+        return ["Tracking event must be an object"]
+
+    missing = _missing_fields_error(event_data, TRACKING_EVENT_REQUIRED_FIELDS)
+    if missing:
+        return [missing]
+
+    errors = []
+    timestamp_error = _timestamp_error(event_data["timestamp"])
+    if timestamp_error:
+        errors.append(timestamp_error)
+
+    location = event_data["location"]
+    if not isinstance(location, str) or len(location) < 1:
+        errors.append("Invalid location")
+
+    event_type = event_data["event_type"]
+    if not isinstance(event_type, str) or event_type not in VALID_EVENT_TYPES:
+        errors.append("Invalid event_type")
+
+    return errors
+
+
+def validate_product_data(product_data: Dict[str, Any]) -> bool:
+    return not _product_errors(product_data)
 
 
 def validate_tracking_event(event_data: Dict[str, Any]) -> bool:
-    required_fields = ["location", "timestamp", "event_type"]
+    return not _tracking_event_errors(event_data)
 
-    # Check required fields
-    if not all(field in event_data for field in required_fields):
-        return False
 
-    # Validate timestamp
-    try:
-        if isinstance(event_data["timestamp"], str):
-            datetime.fromisoformat(event_data["timestamp"].replace("Z", "+00:00"))
-        elif not isinstance(event_data["timestamp"], (int, float)):
-            return False
-    except ValueError:
-        return False
+def _sanitize_cached(
+    input_data: Dict[str, Any], cleaned: Dict[str, str]
+) -> Dict[str, Any]:
+    # Same walk as sanitize_input; strings with control characters are cleaned
+    # once per batch, since sensor uploads repeat locations and tags
+    sanitized = {}
 
-    # Validate location format
-    if not isinstance(event_data["location"], str) or len(event_data["location"]) < 1:
-        return False
+    for key, value in input_data.items():
+        if isinstance(value, str):
+            if value.isprintable():
+                value = value[:MAX_STRING_LENGTH]
+            elif value in cleaned:
+                value = cleaned[value]
+            else:
+                result = CONTROL_CHARACTERS_PATTERN.sub("", value)[:MAX_STRING_LENGTH]
+                cleaned[value] = result
+                value = result
+        elif isinstance(value, dict):
+            value = _sanitize_cached(value, cleaned)
+        elif isinstance(value, list):
+            value = [
+                _sanitize_cached(item, cleaned) if isinstance(item, dict) else item
+                for item in value
+            ]
 
-    # Validate event type
-    valid_event_types = ["created", "shipped", "received", "stored", "delivered"]
-    if event_data["event_type"] not in valid_event_types:
-        return False
+        sanitized[key] = value
 
-    return True
+    return sanitized
+
+
+def validate_products(
+    products: List[Dict[str, Any]], sanitize: bool = True
+) -> Dict[str, Any]:
+    """Validate a batch of products, collecting per-row errors instead of failing"""
+    valid = []
+    valid_indices = []
+    errors = []
+    cleaned = {}
+    for index, product in enumerate(products):
+        error_list = _product_errors(product)
+        if error_list:
+            errors.append({"index": index, "errors": error_list})
+        else:
+            data = _sanitize_cached(product, cleaned) if sanitize else product
+            valid.append(data)
+            valid_indices.append(index)
+    return {"valid": valid, "valid_indices": valid_indices, "errors": errors}
+
+
+def validate_tracking_events(
+    events: List[Dict[str, Any]], sanitize: bool = True
+) -> Dict[str, Any]:
+    """Validate and sanitize a batch of tracking events in one pass.
+
+    Valid rows are checked inline; error messages are only built for rows that
+    fail, using the same checks as validate_tracking_event.
+    """
+    valid = []
+    valid_indices = []
+    errors = []
+    cleaned = {}
+    for index, event in enumerate(events):
+        try:
+            location = event["location"]
+            timestamp = event["timestamp"]
+            event_type = event["event_type"]
+        except (KeyError, TypeError):
+            ok = False
+        else:
+            ok = (
+                isinstance(location, str)
+                and location != ""
+                and isinstance(event_type, str)
+                and event_type in VALID_EVENT_TYPES
+            )
+            if ok:
+                if isinstance(timestamp, str):
+                    try:
+                        datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+                    except ValueError:
+                        ok = False
+                elif not isinstance(timestamp, (int, float)):
+                    ok = False
+
+        if ok and isinstance(event, dict):
+            data = _sanitize_cached(event, cleaned) if sanitize else event
+            valid.append(data)
+            valid_indices.append(index)
+        else:
+            errors.append({"index": index, "errors": _tracking_event_errors(event)})
+    return {"valid": valid, "valid_indices": valid_indices, "errors": errors}
 
 
 def validate_prediction_data(data: Dict[str, Any]) -> bool:
@@ -74,20 +202,19 @@ def sanitize_input(input_data: Dict[str, Any]) -> Dict[str, Any]:
 
     for key, value in input_data.items():
         if isinstance(value, str):
-            # Remove any control characters
-            value = "".join(char for char in value if ord(char) >= 32)
-            # Limit string length
-            value = value[:1000]
-        elif isinstance(value, (list, dict)):
+            # Remove any control characters (printable strings have none) and
+            # limit string length
+            if not value.isprintable():
+                value = CONTROL_CHARACTERS_PATTERN.sub("", value)
+            value = value[:MAX_STRING_LENGTH]
+        elif isinstance(value, dict):
             # Recursively sanitize nested structures
-            value = (
-                sanitize_input(value)
-                if isinstance(value, dict)
-                else [
-                    sanitize_input(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
-            )
+            value = sanitize_input(value)
+        elif isinstance(value, list):
+            value = [
+                sanitize_input(item) if isinstance(item, dict) else item
+                for item in value
+            ]
 
         sanitized[key] = value
 
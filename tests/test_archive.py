@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.database.archive import archive_tracking_events, query_tracking_events
+from src.models.base import Base
+from src.models.supply_chain import (
+    Manufacturer,
+    Product,
+    ProductStatus,
+    TrackingEvent,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'events.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    manufacturer = Manufacturer(name="Acme", location="Berlin")
+    session.add(manufacturer)
+    session.flush()
+    product = Product(
+        name="Widget",
+        manufacturer_id=manufacturer.id,
+        batch_number="BATCH-2024-001",
+        status=ProductStatus.MANUFACTURED,
+    )
+    session.add(product)
+    session.flush()
+
+    now = datetime.utcnow()
+    for days_ago in (400, 300, 200, 150, 120, 100, 30, 20, 10, 1):
+        session.add(
+            TrackingEvent(
+                product_id=product.id,
+                timestamp=now - timedelta(days=days_ago),
+                location=f"Hub-{days_ago}",
+                event_type="shipped",
+                temperature=4.5,
+                additional_data={"days_ago": days_ago},
+            )
+        )
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_query_merges_hot_and_cold_rows(db, tmp_path):
+    archive_path = str(tmp_path / "archive")
+
+    assert archive_tracking_events(db, archive_path=archive_path) == 6
+    assert db.query(TrackingEvent).count() == 4
+
+    events = query_tracking_events(db, archive_path=archive_path)
+    assert len(events) == 10
+    assert events["timestamp"].is_monotonic_increasing
+    assert events["location"].tolist()[0] == "Hub-400"
+    assert events["additional_data"].tolist()[-1] == {"days_ago": 1}
+    assert set(events["manufacturer_id"]) == {1}
+
+    ids = query_tracking_events(db, columns=["id"], archive_path=archive_path)
+    assert list(ids.columns) == ["id"]
+    assert sorted(ids["id"]) == list(range(1, 11))
+
+
+def test_filters_apply_to_both_tiers(db, tmp_path):
+    archive_path = str(tmp_path / "archive")
+    archive_tracking_events(db, archive_path=archive_path)
+
+    start = datetime.utcnow() - timedelta(days=160)
+    events = query_tracking_events(db, start=start, archive_path=archive_path)
+
+    assert events["location"].tolist() == [
+        "Hub-150",
+        "Hub-120",
+        "Hub-100",
+        "Hub-30",
+        "Hub-20",
+        "Hub-10",
+        "Hub-1",
+    ]
+
+
+def test_rows_copied_by_an_interrupted_run_are_not_duplicated(db, tmp_path):
+    archive_path = str(tmp_path / "archive")
+    archive_tracking_events(db, archive_path=archive_path)
+    hot_row = db.query(TrackingEvent).order_by(TrackingEvent.timestamp).first()
+
+    # Re-insert an archived row as if the delete after writing had not run
+    archived = query_tracking_events(db, archive_path=archive_path).iloc[0]
+    db.add(
+        TrackingEvent(
+            id=int(archived["id"]),
+            product_id=hot_row.product_id,
+            timestamp=archived["timestamp"].to_pydatetime(),
+            location=archived["location"],
+            event_type=archived["event_type"],
+        )
+    )
+    db.commit()
+
+    events = query_tracking_events(db, archive_path=archive_path)
+    assert len(events) == 10
+
+
+def test_reused_ids_do_not_hide_archived_rows(db, tmp_path):
+    archive_path = str(tmp_path / "archive")
+    archive_tracking_events(db, archive_path=archive_path)
+    hot_row = db.query(TrackingEvent).order_by(TrackingEvent.timestamp).first()
+
+    # Without AUTOINCREMENT, SQLite may hand out an archived id again
+    db.add(
+        TrackingEvent(
+            id=1,
+            product_id=hot_row.product_id,
+            timestamp=datetime.utcnow(),
+            location="Hub-new",
+            event_type="received",
+        )
+    )
+    db.commit()
+
+    events = query_tracking_events(db, archive_path=archive_path)
+    assert len(events) == 11
+    assert "Hub-400" in events["location"].tolist()
@@ -0,0 +1,51 @@
+import socket
+import threading
+
+import pandas as pd
+
+from src.ai.inference_server import RemotePredictor, _handle_connection
+
+
+class EchoPredictor:
+    def predict_bottlenecks(self, data):
+        return [data.iloc[idx].to_dict() for idx in range(len(data))]
+
+    def predict_demand(self, historical_data):
+        return {"rows": len(historical_data)}
+
+
+def _connected_predictor():
+    client, server = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+    threading.Thread(
+        target=_handle_connection,
+        args=(server, EchoPredictor(), threading.Lock()),
+        daemon=True,
+    ).start()
+    predictor = RemotePredictor(socket_path="unused.sock")
+    predictor._sock = client
+    return predictor
+
+
+def test_results_match_local_predictor():
+    predictor = _connected_predictor()
+    frames = [
+        pd.DataFrame({"units": [1, 2], "orders": [3, 4]}),
+        pd.DataFrame({"units": [1, 2], "delay": [0.5, 1.5]}),
+    ]
+
+    for data in frames:
+        expected = EchoPredictor().predict_bottlenecks(data)
+        result = predictor.predict_bottlenecks(data)
+        assert result == expected
+        assert [type(value) for value in result[0].values()] == [
+            type(value) for value in expected[0].values()
+        ]
+    predictor.close()
+
+
+def test_empty_frame_is_sent():
+    predictor = _connected_predictor()
+    data = pd.DataFrame({"units": pd.Series([], dtype="int64")})
+
+    assert predictor.predict_demand(data) == {"rows": 0}
+    predictor.close()
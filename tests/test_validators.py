@@ -0,0 +1,84 @@
+import pytest
+
+from src.utils.validators import (
+    sanitize_input,
+    validate_product_data,
+    validate_products,
+    validate_tracking_event,
+    validate_tracking_events,
+)
+
+
+def _event(timestamp):
+    return {"location": "Warehouse-1", "timestamp": timestamp, "event_type": "shipped"}
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        "2024",
+        "2024-01",
+        " 2024-01-01",
+        "2024-01-01T10:00:00Z",
+        "1500-01-01T00:00:00",
+        "2500-01-01T00:00:00",
+        "not-a-timestamp",
+        1700000000,
+        None,
+    ],
+)
+def test_batch_and_single_event_validation_agree(timestamp):
+    result = validate_tracking_events([_event(timestamp)])
+
+    assert validate_tracking_event(_event(timestamp)) == (not result["errors"])
+    if result["errors"]:
+        assert result["errors"][0]["errors"] == ["Invalid timestamp"]
+
+
+def test_batch_reports_rows_by_index():
+    events = [
+        _event("2024-01-01T10:00:00Z"),
+        {"location": "", "timestamp": "bad", "event_type": "lost"},
+        {"location": "Port"},
+        "not an event",
+        {**_event(1700000000), "note": "ok\x07", "extra": {"tag": "a\r\nb"}},
+    ]
+
+    result = validate_tracking_events(events)
+
+    assert result["valid_indices"] == [0, 4]
+    assert result["valid"][1]["note"] == "ok"
+    assert result["valid"][1]["extra"] == {"tag": "ab"}
+    assert result["errors"] == [
+        {
+            "index": 1,
+            "errors": ["Invalid timestamp", "Invalid location", "Invalid event_type"],
+        },
+        {"index": 2, "errors": ["Missing required fields: timestamp, event_type"]},
+        {"index": 3, "errors": ["Tracking event must be an object"]},
+    ]
+
+
+def test_batch_sanitization_matches_sanitize_input():
+    events = [
+        {**_event(1), "note": "repeat\x01", "items": [{"x": "\x02y"}, "z\x03"]}
+        for _ in range(3)
+    ] + [{**_event(2), "note": "n" * 1200 + "\x00"}]
+
+    result = validate_tracking_events(events)
+
+    assert result["valid"] == [sanitize_input(event) for event in events]
+
+
+def test_validate_products():
+    products = [
+        {"name": "Widget", "manufacturer": "Acme", "batch_number": "BATCH-2024-001"},
+        {"name": "Widget", "manufacturer": "Acme", "batch_number": 7},
+    ]
+
+    result = validate_products(products)
+
+    assert result["valid_indices"] == [0]
+    assert result["errors"] == [{"index": 1, "errors": ["Invalid batch_number"]}]
+    assert validate_product_data(products[0])
+    assert not validate_product_data(products[1])